@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import itertools
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import polars as pl
 import typer
 from rich.console import Console
 from rich.table import Table
 from typing_extensions import Annotated
 
+if TYPE_CHECKING:
+    import polars as pl
+
+    from CXq_data.storage.duckdb_manager import DuckDBManager
+
 crossvalidate_app = typer.Typer(no_args_is_help=True)
 console = Console()
 
@@ -26,6 +30,50 @@ def _get_manager():
     return DuckDBManager(settings.storage.duckdb_path, settings.storage.processed_dir)
 
 
+def _fetch_pairs(
+    db: DuckDBManager, symbols: list[str], sources: list[str]
+) -> dict[tuple[str, str], pl.DataFrame]:
+    """Load (date, close) rows for every (symbol, source) pair, keyed by the pair.
+
+    Fetches all pairs in one scan of the Parquet dataset rather than
+    re-listing and re-opening the partitions once per pair. If that scan
+    fails (missing view, unreadable partition), falls back to one query per
+    pair so a bad partition only drops its own pair. Pairs with no rows, or
+    whose query fails, are left out of the result.
+    """
+    symbol_in = ", ".join(f"'{s}'" for s in symbols)
+    source_in = ", ".join(f"'{s}'" for s in sources)
+    sql = f"""
+        SELECT symbol, source, date, close
+        FROM daily_ohlcv
+        WHERE symbol IN ({symbol_in}) AND source IN ({source_in})
+        ORDER BY date
+    """
+    try:
+        all_df = db.to_polars(sql)
+    except Exception:
+        pairs: dict[tuple[str, str], pl.DataFrame] = {}
+        for symbol, source in itertools.product(symbols, sources):
+            try:
+                df = db.to_polars(f"""
+                    SELECT date, close
+                    FROM daily_ohlcv
+                    WHERE symbol = '{symbol}' AND source = '{source}'
+                    ORDER BY date
+                """)
+            except Exception:
+                continue
+            if not df.is_empty():
+                pairs[(symbol, source)] = df
+        return pairs
+
+    groups = all_df.partition_by(["symbol", "source"], as_dict=True)
+    return {
+        (str(symbol), str(source)): group.select("date", "close")
+        for (symbol, source), group in groups.items()
+    }
+
+
 @crossvalidate_app.command("compare")
 def crossvalidate_compare(
     symbol: Annotated[str, typer.Option("--symbol", "-s", help="Ticker symbol")],
@@ -35,6 +83,8 @@ def crossvalidate_compare(
     tolerance: Annotated[float, typer.Option("--tolerance", "-t", help="% threshold for price discrepancies")] = 1.0,
 ) -> None:
     """Compare daily OHLCV data across multiple sources for a symbol."""
+    import polars as pl
+
     source_list = [s.strip() for s in sources.split(",")]
     if len(source_list) < 2:
         typer.echo("Error: Need at least 2 sources to compare", err=True)
@@ -101,6 +151,8 @@ def crossvalidate_matrix(
     all_universe: Annotated[bool, typer.Option("--all", help="All symbols in universe")] = False,
 ) -> None:
     """Show a summary matrix of data overlap across sources for multiple symbols."""
+    import polars as pl
+
     from CXq_data.config.loader import get_settings
 
     source_list = [s.strip() for s in sources.split(",")]
@@ -128,49 +180,43 @@ def crossvalidate_matrix(
 
     with manager.connect() as db:
         db.create_views()
+        pairs = _fetch_pairs(db, symbol_list, source_list)
 
-        for symbol in symbol_list:
-            row_counts = []
-            source_dfs = []
+    for symbol in symbol_list:
+        row_counts = []
+        source_dfs = []
 
-            for source in source_list:
-                sql = f"""
-                    SELECT date, close
-                    FROM daily_ohlcv
-                    WHERE symbol = '{symbol}' AND source = '{source}'
-                    ORDER BY date
-                """
-                try:
-                    df = db.to_polars(sql)
-                except Exception:
-                    df = pl.DataFrame()
-
-                row_counts.append(str(len(df)))
-                source_dfs.append(df)
-
-            # Compute overlap and max diff between first two sources
-            overlap_pct = "-"
-            max_diff = "-"
-
-            if len(source_dfs) >= 2 and not source_dfs[0].is_empty() and not source_dfs[1].is_empty():
-                dates_a = set(source_dfs[0]["date"].to_list())
-                dates_b = set(source_dfs[1]["date"].to_list())
-                common = dates_a & dates_b
-                total = dates_a | dates_b
-
-                if total:
-                    overlap_pct = f"{len(common) / len(total) * 100:.1f}%"
-
-                if common:
-                    joined = source_dfs[0].join(source_dfs[1], on="date", suffix="_b")
-                    diffs = (
-                        (joined["close"] - joined["close_b"]).abs()
-                        / joined["close"]
-                        * 100
-                    )
-                    max_diff = f"{diffs.max():.3f}%"
-
-            table.add_row(symbol, *row_counts, overlap_pct, max_diff)
+        for source in source_list:
+            df = pairs.get((symbol, source), pl.DataFrame())
+
+            row_counts.append(str(len(df)))
+            source_dfs.append(df)
+
+        # Compute overlap and max diff between first two sources
+        overlap_pct = "-"
+        max_diff = "-"
+
+        if len(source_dfs) >= 2 and not source_dfs[0].is_empty() and not source_dfs[1].is_empty():
+            dates_a = set(source_dfs[0]["date"].to_list())
+            dates_b = set(source_dfs[1]["date"].to_list())
+            common = dates_a & dates_b
+            total = dates_a | dates_b
+
+            if total:
+                overlap_pct = f"{len(common) / len(total) * 100:.1f}%"
+
+            if common:
+                joined = source_dfs[0].join(source_dfs[1], on="date", suffix="_b")
+                diffs = (
+                    (joined["close"] - joined["close_b"]).abs()
+                    / joined["close"]
+                    * 100
+                )
+                worst = diffs.max()
+                assert isinstance(worst, float)
+                max_diff = f"{worst:.3f}%"
+
+        table.add_row(symbol, *row_counts, overlap_pct, max_diff)
 
     console.print(table)
 
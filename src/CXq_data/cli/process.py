@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from typing_extensions import Annotated
 
+if TYPE_CHECKING:
+    from CXq_data.config.settings import StorageSettings
+
 process_app = typer.Typer(no_args_is_help=True)
 
 
@@ -22,23 +28,50 @@ def _find_raw_files(raw_dir: Path, source: str, symbols: list[str]) -> list[tupl
 
     for symbol in symbols:
         symbol_dir = source_dir / symbol
-        if not symbol_dir.exists():
+
+        # One directory read per symbol; a missing directory surfaces here
+        # instead of needing a separate exists() stat
+        try:
+            with os.scandir(symbol_dir) as entries:
+                names = [e.name for e in entries]
+        except (FileNotFoundError, NotADirectoryError):
             typer.echo(f"  No raw data for {symbol} from {source}", err=True)
             continue
+        except PermissionError as e:
+            typer.echo(f"  [ERROR] {symbol}: {e}", err=True)
+            continue
 
-        # Find the most recent daily CSV/JSON file
-        files = sorted(symbol_dir.glob("*_daily.*"), reverse=True)
-        # Filter out metadata files
-        files = [f for f in files if not f.name.endswith(".meta.json")]
+        # Find the most recent daily CSV/JSON file, skipping metadata files
+        daily = [
+            n for n in fnmatch.filter(names, "*_daily.*") if not n.endswith(".meta.json")
+        ]
 
-        if files:
-            results.append((symbol, files[0]))
+        if daily:
+            results.append((symbol, symbol_dir / max(daily)))
         else:
             typer.echo(f"  No raw daily files for {symbol}", err=True)
 
     return results
 
 
+def _process_symbol(
+    source: str, symbol: str, raw_path: Path, storage: StorageSettings
+) -> list[Path]:
+    """Normalize one raw file and write its partitions."""
+    from CXq_data.processing.normalizer import normalize
+    from CXq_data.processing.partitioner import mark_processed, write_partitioned
+
+    df = normalize(source, raw_path, symbol)
+    written = write_partitioned(
+        df,
+        storage.processed_dir,
+        compression=storage.parquet_compression,
+        compression_level=storage.parquet_compression_level,
+    )
+    mark_processed(raw_path, storage.processed_dir, symbol, source)
+    return written
+
+
 @process_app.command("run")
 def process_run(
     source: Annotated[str, typer.Option("--source", "-s", help="Source name: 'yfinance' or 'alpha_vantage'")],
@@ -48,11 +81,21 @@ def process_run(
     all_universe: Annotated[
         bool, typer.Option("--all", help="Process all symbols in configured universe")
     ] = False,
+    workers: Annotated[
+        Optional[int],
+        typer.Option("--workers", "-w", min=1, help="Parallel workers (default: CPU count)"),
+    ] = None,
+    force: Annotated[
+        bool, typer.Option("--force", help="Rewrite partitions even if raw data is unchanged")
+    ] = False,
 ) -> None:
-    """Process raw files into Hive-partitioned Parquet."""
+    """Process raw files into Hive-partitioned Parquet.
+
+    Symbols whose partitions were last fully written from the same raw file
+    (name, mtime and size unchanged) are skipped unless --force is given.
+    """
     from CXq_data.config.loader import get_settings
-    from CXq_data.processing.normalizer import normalize
-    from CXq_data.processing.partitioner import write_partitioned
+    from CXq_data.processing.partitioner import is_up_to_date
 
     settings = get_settings()
 
@@ -64,23 +107,49 @@ def process_run(
         typer.echo("Error: Provide --symbols or --all", err=True)
         raise typer.Exit(1)
 
+    # Drop repeats (keeping order) so one symbol is never written by two workers at once
+    symbol_list = list(dict.fromkeys(symbol_list))
+
     raw_files = _find_raw_files(settings.storage.raw_dir, source, symbol_list)
     if not raw_files:
         typer.echo("No raw files found to process.")
         raise typer.Exit(1)
 
+    if not force:
+        stale = []
+        for symbol, raw_path in raw_files:
+            if is_up_to_date(raw_path, settings.storage.processed_dir, symbol, source):
+                typer.echo(f"  {symbol}: up to date, skipping (use --force to rewrite)")
+            else:
+                stale.append((symbol, raw_path))
+        raw_files = stale
+
+        if not raw_files:
+            typer.echo("Done. All partitions up to date.")
+            return
+
     typer.echo(f"Processing {len(raw_files)} symbol(s) from '{source}'")
 
+    # Symbols are independent and Polars releases the GIL while parsing and
+    # writing, so a thread pool overlaps the per-symbol work
+    max_workers = min(len(raw_files), workers or os.cpu_count() or 1)
+
     total_written = 0
-    for symbol, raw_path in raw_files:
-        try:
-            df = normalize(source, raw_path, symbol)
-            paths = write_partitioned(df, settings.storage.processed_dir)
-            total_written += len(paths)
-            for p in paths:
-                typer.echo(f"  {symbol} -> {p}")
-        except Exception as e:
-            typer.echo(f"  [ERROR] {symbol}: {e}", err=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_process_symbol, source, symbol, raw_path, settings.storage)
+            for symbol, raw_path in raw_files
+        ]
+
+        # Report in submission order so output is stable across runs
+        for (symbol, _), future in zip(raw_files, futures, strict=True):
+            try:
+                paths = future.result()
+                total_written += len(paths)
+                for p in paths:
+                    typer.echo(f"  {symbol} -> {p}")
+            except Exception as e:
+                typer.echo(f"  [ERROR] {symbol}: {e}", err=True)
 
     typer.echo(f"Done. {total_written} partition(s) written.")
 
@@ -94,7 +163,17 @@ def process_reprocess(
     all_universe: Annotated[
         bool, typer.Option("--all", help="Reprocess all symbols")
     ] = False,
+    workers: Annotated[
+        Optional[int],
+        typer.Option("--workers", "-w", min=1, help="Parallel workers (default: CPU count)"),
+    ] = None,
 ) -> None:
     """Force re-process raw files (overwrites existing partitions)."""
-    # Reprocess is identical to run since our writes are idempotent (overwrite)
-    process_run(source=source, symbols=symbols, all_universe=all_universe)
+    # Reprocess is run with the staleness check disabled; writes are idempotent (overwrite)
+    process_run(
+        source=source,
+        symbols=symbols,
+        all_universe=all_universe,
+        workers=workers,
+        force=True,
+    )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
@@ -11,6 +11,11 @@ from typing_extensions import Annotated
 
 from CXq_data.validation.models import CheckStatus
 
+if TYPE_CHECKING:
+    import polars as pl
+
+    from CXq_data.storage.duckdb_manager import DuckDBManager
+
 validate_app = typer.Typer(no_args_is_help=True)
 console = Console()
 
@@ -21,6 +26,34 @@ STATUS_STYLES = {
 }
 
 
+def _fetch_by_symbol(db: DuckDBManager, symbols: list[str]) -> dict[str, pl.DataFrame]:
+    """Load daily_ohlcv rows for all symbols in one query, split per symbol.
+
+    Symbols with no rows map to an empty frame with the view's columns. If
+    the batched query fails (missing view, unreadable partition), falls back
+    to one query per symbol so a bad partition only drops its own symbol;
+    symbols whose query fails are left out of the result.
+    """
+    symbol_in = ", ".join(f"'{s}'" for s in symbols)
+    try:
+        df = db.to_polars(
+            f"SELECT * FROM daily_ohlcv WHERE symbol IN ({symbol_in}) ORDER BY date"
+        )
+    except Exception:
+        dfs: dict[str, pl.DataFrame] = {}
+        for symbol in symbols:
+            try:
+                dfs[symbol] = db.to_polars(
+                    f"SELECT * FROM daily_ohlcv WHERE symbol = '{symbol}' ORDER BY date"
+                )
+            except Exception:
+                continue
+        return dfs
+
+    groups = df.partition_by("symbol", as_dict=True)
+    return {s: groups.get((s,), df.clear()) for s in symbols}
+
+
 @validate_app.command("run")
 def validate_run(
     symbols: Annotated[
@@ -49,18 +82,15 @@ def validate_run(
 
     with manager.connect() as db:
         db.create_views()
+        dfs = _fetch_by_symbol(db, symbol_list)
 
-        for symbol in symbol_list:
-            try:
-                df = db.to_polars(
-                    f"SELECT * FROM daily_ohlcv WHERE symbol = '{symbol}' ORDER BY date"
-                )
-            except Exception:
-                typer.echo(f"\n{symbol}: No data found (daily_ohlcv view may not exist)")
-                continue
+    for symbol in symbol_list:
+        if symbol not in dfs:
+            typer.echo(f"\n{symbol}: No data found (daily_ohlcv view may not exist)")
+            continue
 
-            report = run_all_checks(df, symbol)
-            _print_report(report)
+        report = run_all_checks(dfs[symbol], symbol)
+        _print_report(report)
 
 
 @validate_app.command("report")
@@ -85,28 +115,25 @@ def validate_report(
 
     with manager.connect() as db:
         db.create_views()
-
-        for symbol in settings.universe.symbols:
-            try:
-                df = db.to_polars(
-                    f"SELECT * FROM daily_ohlcv WHERE symbol = '{symbol}' ORDER BY date"
-                )
-            except Exception:
-                summary_table.add_row(symbol, "[red]NO DATA[/red]", "-", "-")
-                continue
-
-            report = run_all_checks(df, symbol)
-            passed = sum(1 for r in report.results if r.status == CheckStatus.PASS)
-            total = len(report.results)
-            issues = [r.check_name for r in report.results if r.status != CheckStatus.PASS]
-
-            style = STATUS_STYLES.get(report.overall_status, "white")
-            summary_table.add_row(
-                symbol,
-                f"[{style}]{report.overall_status.value.upper()}[/{style}]",
-                f"{passed}/{total}",
-                ", ".join(issues) if issues else "-",
-            )
+        dfs = _fetch_by_symbol(db, settings.universe.symbols)
+
+    for symbol in settings.universe.symbols:
+        if symbol not in dfs:
+            summary_table.add_row(symbol, "[red]NO DATA[/red]", "-", "-")
+            continue
+
+        report = run_all_checks(dfs[symbol], symbol)
+        passed = sum(1 for r in report.results if r.status == CheckStatus.PASS)
+        total = len(report.results)
+        issues = [r.check_name for r in report.results if r.status != CheckStatus.PASS]
+
+        style = STATUS_STYLES.get(report.overall_status, "white")
+        summary_table.add_row(
+            symbol,
+            f"[{style}]{report.overall_status.value.upper()}[/{style}]",
+            f"{passed}/{total}",
+            ", ".join(issues) if issues else "-",
+        )
 
     console.print(summary_table)
 
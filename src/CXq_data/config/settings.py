@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import datetime
 from pathlib import Path
+from typing import Literal
 
-from pydantic import Field, SecretStr
+from pydantic import Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 try:
@@ -15,6 +16,15 @@ try:
 except ImportError:
     _HAS_TOML = False
 
+ParquetCompression = Literal["zstd", "snappy", "lz4", "gzip", "brotli", "uncompressed"]
+
+# Valid compression_level range per codec; the others ignore the level
+_COMPRESSION_LEVELS: dict[str, tuple[int, int]] = {
+    "zstd": (1, 22),
+    "gzip": (0, 9),
+    "brotli": (0, 11),
+}
+
 
 class SourceAlphaVantageSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="AV_")
@@ -59,6 +69,27 @@ class StorageSettings(BaseSettings):
 
     data_root: Path = Field(default=Path("data"), description="Root directory for all data")
     duckdb_filename: str = Field(default="CXq_data.duckdb")
+    parquet_compression: ParquetCompression = Field(
+        default="zstd",
+        description="Parquet codec: zstd, snappy, lz4, gzip, brotli, or uncompressed",
+    )
+    parquet_compression_level: int | None = Field(
+        default=None,
+        ge=0,
+        le=22,
+        description="Codec level (None uses the codec's default; zstd 1-22, gzip 0-9, brotli 0-11)",
+    )
+
+    @model_validator(mode="after")
+    def _check_compression_level(self) -> StorageSettings:
+        level = self.parquet_compression_level
+        bounds = _COMPRESSION_LEVELS.get(self.parquet_compression)
+        if level is not None and bounds is not None and not bounds[0] <= level <= bounds[1]:
+            raise ValueError(
+                f"parquet_compression_level {level} is out of range for "
+                f"{self.parquet_compression} ({bounds[0]}-{bounds[1]})"
+            )
+        return self
 
     @property
     def raw_dir(self) -> Path:
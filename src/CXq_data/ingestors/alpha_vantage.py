@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 from pathlib import Path
 
 import httpx
@@ -70,13 +69,13 @@ class AlphaVantageIngestor:
         if not time_series:
             raise IngestorError(f"No daily data in response for {symbol}")
 
-        # Write raw JSON
+        # Write raw JSON — the response body as received, no re-serialization
         out_path = output_dir / self.source_name / symbol
         out_path.mkdir(parents=True, exist_ok=True)
 
         filename = f"{datetime.date.today().isoformat()}_daily.json"
         file_path = out_path / filename
-        file_path.write_text(json.dumps(raw_data, indent=2))
+        file_path.write_bytes(response.content)
 
         # Filter dates to requested range and compute stats
         dates = sorted(time_series.keys())
@@ -163,7 +162,7 @@ class AlphaVantageIngestor:
 
         filename = f"{datetime.date.today().isoformat()}_{av_interval}.json"
         file_path = out_path / filename
-        file_path.write_text(json.dumps(raw_data, indent=2))
+        file_path.write_bytes(response.content)
 
         dates = sorted(time_series.keys())
         actual_start = datetime.date.fromisoformat(dates[0][:10]) if dates else start_date
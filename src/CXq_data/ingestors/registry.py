@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 from typing import TYPE_CHECKING
 
 from CXq_data.ingestors.base import BaseIngestor, IngestorError
@@ -9,9 +10,16 @@ from CXq_data.ingestors.base import BaseIngestor, IngestorError
 if TYPE_CHECKING:
     from CXq_data.config.settings import AppSettings
 
-# Registry populated at import time by each ingestor module
+# Registry of ingestor classes, populated by register() and on first use of a built-in
 _REGISTRY: dict[str, type] = {}
 
+# Built-in ingestors as (module, class) — imported only when their key is requested
+_BUILTINS: dict[str, tuple[str, str]] = {
+    "yf": ("CXq_data.ingestors.yfinance", "YFinanceIngestor"),
+    "av": ("CXq_data.ingestors.alpha_vantage", "AlphaVantageIngestor"),
+    "stooq": ("CXq_data.ingestors.stooq", "StooqIngestor"),
+}
+
 
 def register(key: str, cls: type) -> None:
     """Register an ingestor class under a source key."""
@@ -23,12 +31,12 @@ def get_ingestor(key: str, settings: AppSettings) -> BaseIngestor:
 
     Lazy-imports ingestor modules to avoid importing unused dependencies.
     """
-    # Lazy registration on first call
-    if not _REGISTRY:
-        _load_builtins()
+    # Lazy registration of just the requested source
+    if key not in _REGISTRY and key in _BUILTINS:
+        _load_builtin(key)
 
     if key not in _REGISTRY:
-        available = ", ".join(sorted(_REGISTRY.keys()))
+        available = ", ".join(available_sources())
         raise IngestorError(
             f"Unknown source '{key}'. Available sources: {available}"
         )
@@ -45,26 +53,21 @@ def get_ingestor(key: str, settings: AppSettings) -> BaseIngestor:
         return cls(settings)  # type: ignore[return-value]
 
 
-def _load_builtins() -> None:
-    """Lazy-import built-in ingestors to populate the registry."""
-    from CXq_data.ingestors.yfinance import YFinanceIngestor
-
-    register("yf", YFinanceIngestor)
+def _load_builtin(key: str) -> None:
+    """Import a single built-in ingestor module and register its class.
 
+    Only the requested provider's SDK is loaded, e.g. using Stooq never
+    imports yfinance (and pandas with it).
+    """
+    module_name, class_name = _BUILTINS[key]
     try:
-        from CXq_data.ingestors.alpha_vantage import AlphaVantageIngestor
-
-        register("av", AlphaVantageIngestor)
-    except ImportError:
-        pass
-
-    from CXq_data.ingestors.stooq import StooqIngestor
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise IngestorError(f"Source '{key}' is unavailable: {e}") from e
 
-    register("stooq", StooqIngestor)
+    register(key, getattr(module, class_name))
 
 
 def available_sources() -> list[str]:
     """Return list of registered source keys."""
-    if not _REGISTRY:
-        _load_builtins()
-    return sorted(_REGISTRY.keys())
+    return sorted(_REGISTRY.keys() | _BUILTINS.keys())
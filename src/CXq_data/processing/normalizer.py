@@ -10,6 +10,13 @@ import polars as pl
 
 from CXq_data.processing.schemas import DAILY_OHLCV_COLUMNS
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 def normalize_yfinance_daily(raw_path: Path, symbol: str) -> pl.DataFrame:
     """Normalize a yfinance daily CSV to the canonical schema.
@@ -84,32 +91,41 @@ def normalize_alpha_vantage_daily(raw_path: Path, symbol: str) -> pl.DataFrame:
         }
     }
     """
-    with open(raw_path) as f:
-        data = json.load(f)
+    # Full-history responses run to several MB; orjson parses them much faster
+    raw_bytes = raw_path.read_bytes()
+    data = orjson.loads(raw_bytes) if _HAS_ORJSON else json.loads(raw_bytes)
 
     time_series = data.get("Time Series (Daily)", {})
     if not time_series:
         raise ValueError(f"No 'Time Series (Daily)' found in {raw_path}")
 
-    rows = []
-    for date_str, values in time_series.items():
-        rows.append(
-            {
-                "date": date_str,
-                "open": float(values["1. open"]),
-                "high": float(values["2. high"]),
-                "low": float(values["3. low"]),
-                "close": float(values["4. close"]),
-                "volume": int(values["6. volume"]),
-                "adjusted_close": float(values.get("5. adjusted close", values["4. close"])),
-            }
-        )
+    # Gather each field as a column of raw strings and let Polars cast them
+    # in bulk, rather than converting and building a dict per row
+    values = list(time_series.values())
+    df = pl.DataFrame(
+        {
+            "date": list(time_series.keys()),
+            "open": [v["1. open"] for v in values],
+            "high": [v["2. high"] for v in values],
+            "low": [v["3. low"] for v in values],
+            "close": [v["4. close"] for v in values],
+            "volume": [v["6. volume"] for v in values],
+            "adjusted_close": [v.get("5. adjusted close") for v in values],
+        },
+        schema_overrides={"adjusted_close": pl.Utf8},
+    )
 
     now_utc = datetime.datetime.now(datetime.timezone.utc)
 
-    df = pl.DataFrame(rows)
     df = df.with_columns(
         pl.col("date").str.to_date("%Y-%m-%d"),
+        pl.col("open").cast(pl.Float64),
+        pl.col("high").cast(pl.Float64),
+        pl.col("low").cast(pl.Float64),
+        pl.col("close").cast(pl.Float64),
+        pl.col("volume").cast(pl.Int64),
+        # Fall back to close where the adjusted value is missing
+        pl.coalesce("adjusted_close", "close").cast(pl.Float64).alias("adjusted_close"),
         pl.lit("alpha_vantage").alias("source"),
         pl.lit(now_utc).alias("ingested_at"),
         pl.lit(symbol).alias("symbol"),
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import os
+import uuid
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import polars as pl
 
 from CXq_data.processing.schemas import DAILY_OHLCV_COLUMNS
 from CXq_data.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from CXq_data.config.settings import ParquetCompression
+
 logger = get_logger(__name__)
 
 
@@ -23,11 +30,15 @@ def write_partitioned(
     df: pl.DataFrame,
     processed_dir: Path,
     dataset: str = "daily_ohlcv",
+    compression: ParquetCompression = "zstd",
+    compression_level: int | None = None,
 ) -> list[Path]:
     """Write a normalized DataFrame to Hive-partitioned Parquet.
 
     Groups by (symbol, source, year), writes one file per group.
-    Overwrites existing partition files (idempotent rewrite).
+    Overwrites existing partition files (idempotent rewrite). Each file is
+    written to a temp name and renamed into place, so readers never see a
+    partially written partition.
 
     Path layout: dataset/symbol=X/source=Y/year=Z/data.parquet
     This allows multiple sources to coexist for cross-validation.
@@ -35,6 +46,9 @@ def write_partitioned(
     Partition columns (symbol, source, year) are dropped from the Parquet
     file content since DuckDB reconstructs them from the directory path.
 
+    compression/compression_level select the Parquet codec, trading write
+    speed against file size (e.g. "snappy" or zstd level 1 for fast writes).
+
     Returns list of written file paths.
     """
     # Derive year from date for partitioning
@@ -57,11 +71,21 @@ def write_partitioned(
         # Drop partition columns — DuckDB extracts them from the path
         write_df = group_df.select(_PARQUET_COLUMNS)
 
-        write_df.write_parquet(
-            out_path,
-            compression="zstd",
-            statistics=True,
-        )
+        # Hidden temp name that the DuckDB "*.parquet" glob does not match,
+        # unique per call so concurrent writers never share or delete each other's
+        # file. Polars creates it, so the mode follows the umask like data.parquet.
+        tmp_path = partition_dir / f".data.{uuid.uuid4().hex}.parquet.tmp"
+        try:
+            write_df.write_parquet(
+                tmp_path,
+                compression=compression,
+                compression_level=compression_level,
+                statistics=True,
+            )
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         logger.info(
             "partition_written",
@@ -74,3 +98,64 @@ def write_partitioned(
         written.append(out_path)
 
     return written
+
+
+def _marker_path(processed_dir: Path, symbol: str, source: str, dataset: str) -> Path:
+    """Hidden per-(symbol, source) marker, outside the DuckDB "*.parquet" glob."""
+    return processed_dir / dataset / f"symbol={symbol}" / f"source={source}" / ".processed.json"
+
+
+def _raw_fingerprint(raw_path: Path) -> dict[str, str | int]:
+    stat = raw_path.stat()
+    return {"raw_file": raw_path.name, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def mark_processed(
+    raw_path: Path,
+    processed_dir: Path,
+    symbol: str,
+    source: str,
+    dataset: str = "daily_ohlcv",
+) -> None:
+    """Record that every partition for (symbol, source) was written from raw_path.
+
+    Call only after write_partitioned has succeeded for the whole file, so a
+    partial failure leaves the previous marker (or none) and the next run
+    reprocesses the symbol.
+    """
+    marker = _marker_path(processed_dir, symbol, source, dataset)
+    marker.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = marker.parent / f".processed.{uuid.uuid4().hex}.tmp"
+    try:
+        tmp_path.write_text(json.dumps(_raw_fingerprint(raw_path)))
+        os.replace(tmp_path, marker)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def is_up_to_date(
+    raw_path: Path,
+    processed_dir: Path,
+    symbol: str,
+    source: str,
+    dataset: str = "daily_ohlcv",
+) -> bool:
+    """Check whether the partitions for (symbol, source) were built from raw_path as it is now.
+
+    Compares the raw file's name, mtime and size against the marker left by
+    mark_processed, so repeat runs can skip an unchanged raw file with a
+    couple of stat() calls instead of a full parse and rewrite. Any
+    difference (a newer download, or a rollback to an older file) counts as
+    changed. Returns False if there is no marker or no partitions.
+    """
+    marker = _marker_path(processed_dir, symbol, source, dataset)
+    try:
+        recorded = json.loads(marker.read_text())
+    except (FileNotFoundError, ValueError):
+        return False
+
+    if recorded != _raw_fingerprint(raw_path):
+        return False
+    return any(marker.parent.glob("year=*/data.parquet"))
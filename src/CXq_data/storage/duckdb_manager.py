@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
@@ -41,20 +42,21 @@ class DuckDBManager:
         assert self._conn is not None, "Not connected. Use `with manager.connect():`"
 
         created = []
-        if not self._processed_dir.exists():
+        try:
+            # scandir reports entry types without a stat() per entry
+            with os.scandir(self._processed_dir) as entries:
+                dataset_dirs = [Path(e.path) for e in entries if e.is_dir()]
+        except FileNotFoundError:
             logger.warning("processed_dir_missing", path=str(self._processed_dir))
             return created
 
-        for dataset_dir in self._processed_dir.iterdir():
-            if not dataset_dir.is_dir():
-                continue
-
+        for dataset_dir in dataset_dirs:
             dataset_name = dataset_dir.name
             glob_pattern = str(dataset_dir / "**" / "*.parquet")
 
-            # Check if any parquet files exist
-            parquet_files = list(dataset_dir.rglob("*.parquet"))
-            if not parquet_files:
+            # Check if any parquet files exist — stop at the first one, since
+            # DuckDB lists the full tree itself when the view is queried
+            if next(dataset_dir.rglob("*.parquet"), None) is None:
                 logger.warning("no_parquet_files", dataset=dataset_name)
                 continue
 
@@ -69,7 +71,7 @@ class DuckDBManager:
             """
             self._conn.execute(sql)
             created.append(dataset_name)
-            logger.info("view_created", view=dataset_name, files=len(parquet_files))
+            logger.info("view_created", view=dataset_name)
 
         return created
 
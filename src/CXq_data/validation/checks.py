@@ -22,31 +22,28 @@ def check_trading_day_gaps(df: pl.DataFrame, symbol: str) -> CheckResult:
             message=f"No data for {symbol}",
         )
 
-    dates = df.select("date").to_series().sort()
-    start = dates.min()
-    end = dates.max()
+    dates = df.get_column("date")
+    start, end = dates.min(), dates.max()
+    assert isinstance(start, datetime.date) and isinstance(end, datetime.date)
 
-    expected = set(trading_days_between(start, end))
-    actual = set(dates.to_list())
-    missing = sorted(expected - actual)
+    # Build the weekday calendar and anti-join in Polars rather than
+    # walking every calendar day and set-differencing in Python
+    calendar = pl.date_range(start, end, interval="1d", eager=True)
+    expected = calendar.filter(calendar.dt.weekday().le(5))  # 1=Monday ... 7=Sunday
+    missing = expected.filter(expected.is_in(dates.implode()).not_())
 
-    if not missing:
+    if missing.is_empty():
         return CheckResult(
             check_name="trading_day_gaps",
             status=CheckStatus.PASS,
-            message=f"No gaps found ({len(actual)} trading days)",
+            message=f"No gaps found ({dates.n_unique()} trading days)",
         )
 
-    # Find consecutive gap runs
-    max_gap = 1
-    current_gap = 1
-    for i in range(1, len(missing)):
-        delta = (missing[i] - missing[i - 1]).days
-        if delta <= 3:  # Within a long weekend
-            current_gap += 1
-            max_gap = max(max_gap, current_gap)
-        else:
-            current_gap = 1
+    # Find consecutive gap runs: a new run starts wherever the step from the
+    # previous missing day is more than a long weekend
+    run_starts = (missing.diff().dt.total_days() > 3).fill_null(True)
+    max_gap = run_starts.cum_sum().unique_counts().max()
+    assert isinstance(max_gap, int)
 
     status = CheckStatus.FAIL if max_gap > 3 else CheckStatus.WARN
 
@@ -54,7 +51,7 @@ def check_trading_day_gaps(df: pl.DataFrame, symbol: str) -> CheckResult:
         check_name="trading_day_gaps",
         status=status,
         message=f"{len(missing)} missing trading day(s), longest gap: {max_gap}",
-        details={"missing_dates": [d.isoformat() for d in missing[:20]]},
+        details={"missing_dates": [d.isoformat() for d in missing.head(20).to_list()]},
     )
 
 
@@ -66,26 +63,30 @@ def check_price_sanity(df: pl.DataFrame, symbol: str) -> CheckResult:
     """
     issues = []
 
-    negative = df.filter(
-        (pl.col("open") < 0)
-        | (pl.col("high") < 0)
-        | (pl.col("low") < 0)
-        | (pl.col("close") < 0)
-    )
-    if len(negative) > 0:
-        issues.append(f"{len(negative)} rows with negative prices")
+    # Count every condition in one pass instead of materializing a filtered frame each
+    counts = df.select(
+        (
+            (pl.col("open") < 0)
+            | (pl.col("high") < 0)
+            | (pl.col("low") < 0)
+            | (pl.col("close") < 0)
+        ).sum().alias("negative"),
+        (pl.col("high") < pl.col("low")).sum().alias("high_low"),
+        (pl.col("close") == 0).sum().alias("zero_close"),
+        (pl.col("volume") < 0).sum().alias("neg_volume"),
+    ).row(0, named=True)
+
+    if counts["negative"] > 0:
+        issues.append(f"{counts['negative']} rows with negative prices")
 
-    high_low = df.filter(pl.col("high") < pl.col("low"))
-    if len(high_low) > 0:
-        issues.append(f"{len(high_low)} rows where high < low")
+    if counts["high_low"] > 0:
+        issues.append(f"{counts['high_low']} rows where high < low")
 
-    zero_close = df.filter(pl.col("close") == 0)
-    if len(zero_close) > 0:
-        issues.append(f"{len(zero_close)} rows with zero close")
+    if counts["zero_close"] > 0:
+        issues.append(f"{counts['zero_close']} rows with zero close")
 
-    neg_volume = df.filter(pl.col("volume") < 0)
-    if len(neg_volume) > 0:
-        issues.append(f"{len(neg_volume)} rows with negative volume")
+    if counts["neg_volume"] > 0:
+        issues.append(f"{counts['neg_volume']} rows with negative volume")
 
     if not issues:
         return CheckResult(
@@ -141,20 +142,25 @@ def check_ohlc_consistency(df: pl.DataFrame, symbol: str) -> CheckResult:
     """
     issues = []
 
-    flat = df.filter(
-        (pl.col("open") == pl.col("high"))
-        & (pl.col("high") == pl.col("low"))
-        & (pl.col("low") == pl.col("close"))
-    )
-    if len(flat) > 0:
-        issues.append(f"{len(flat)} rows with identical OHLC (possible placeholder)")
-
-    zero_vol_movement = df.filter(
-        (pl.col("volume") == 0)
-        & (((pl.col("close") - pl.col("open")).abs() / pl.col("open")) > 0.01)
-    )
-    if len(zero_vol_movement) > 0:
-        issues.append(f"{len(zero_vol_movement)} rows with zero volume but >1% price movement")
+    counts = df.select(
+        (
+            (pl.col("open") == pl.col("high"))
+            & (pl.col("high") == pl.col("low"))
+            & (pl.col("low") == pl.col("close"))
+        ).sum().alias("flat"),
+        (
+            (pl.col("volume") == 0)
+            & (((pl.col("close") - pl.col("open")).abs() / pl.col("open")) > 0.01)
+        ).sum().alias("zero_vol_movement"),
+    ).row(0, named=True)
+
+    if counts["flat"] > 0:
+        issues.append(f"{counts['flat']} rows with identical OHLC (possible placeholder)")
+
+    if counts["zero_vol_movement"] > 0:
+        issues.append(
+            f"{counts['zero_vol_movement']} rows with zero volume but >1% price movement"
+        )
 
     if not issues:
         return CheckResult(
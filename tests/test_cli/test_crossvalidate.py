@@ -0,0 +1,62 @@
+"""Tests for the crossvalidate CLI helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+
+from CXq_data.cli.crossvalidate import _fetch_pairs
+from CXq_data.processing.partitioner import write_partitioned
+from CXq_data.storage.duckdb_manager import DuckDBManager
+
+
+def _write_source(df: pl.DataFrame, processed: Path, symbol: str, source: str) -> list[Path]:
+    return write_partitioned(
+        df.with_columns(symbol=pl.lit(symbol), source=pl.lit(source)), processed
+    )
+
+
+def test_fetch_pairs_groups_by_symbol_and_source(tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame):
+    """Rows are split per (symbol, source); pairs without rows are absent."""
+    processed = tmp_data_dir / "processed"
+    _write_source(sample_ohlcv_df, processed, "AAPL", "yfinance")
+    _write_source(sample_ohlcv_df.head(3), processed, "AAPL", "stooq")
+    _write_source(sample_ohlcv_df.head(2), processed, "MSFT", "stooq")
+    manager = DuckDBManager(tmp_data_dir / "test.duckdb", processed)
+
+    with manager.connect() as db:
+        db.create_views()
+        pairs = _fetch_pairs(db, ["AAPL", "MSFT"], ["yfinance", "stooq"])
+
+    assert set(pairs) == {("AAPL", "yfinance"), ("AAPL", "stooq"), ("MSFT", "stooq")}
+    assert len(pairs[("AAPL", "yfinance")]) == 5
+    assert len(pairs[("AAPL", "stooq")]) == 3
+    assert pairs[("MSFT", "stooq")].columns == ["date", "close"]
+    assert pairs[("AAPL", "yfinance")]["date"].is_sorted()
+
+
+def test_fetch_pairs_isolates_corrupt_partition(tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame):
+    """An unreadable partition only drops its own pair."""
+    processed = tmp_data_dir / "processed"
+    _write_source(sample_ohlcv_df, processed, "AAPL", "yfinance")
+    _write_source(sample_ohlcv_df, processed, "AAPL", "stooq")
+    bad = _write_source(sample_ohlcv_df, processed, "MSFT", "stooq")
+    bad[0].write_bytes(b"not a parquet file")
+    manager = DuckDBManager(tmp_data_dir / "test.duckdb", processed)
+
+    with manager.connect() as db:
+        db.create_views()
+        pairs = _fetch_pairs(db, ["AAPL", "MSFT"], ["yfinance", "stooq"])
+
+    assert set(pairs) == {("AAPL", "yfinance"), ("AAPL", "stooq")}
+    assert len(pairs[("AAPL", "stooq")]) == 5
+
+
+def test_fetch_pairs_missing_view(tmp_data_dir: Path):
+    """Without a daily_ohlcv view no pair is returned."""
+    manager = DuckDBManager(tmp_data_dir / "test.duckdb", tmp_data_dir / "processed")
+
+    with manager.connect() as db:
+        db.create_views()
+        assert _fetch_pairs(db, ["AAPL"], ["yfinance", "stooq"]) == {}
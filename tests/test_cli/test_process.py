@@ -0,0 +1,67 @@
+"""Tests for the process CLI helpers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from CXq_data.cli.process import _find_raw_files, _process_symbol
+from CXq_data.config.settings import StorageSettings
+from CXq_data.processing.partitioner import is_up_to_date
+
+
+def test_find_raw_files_skips_unreadable_symbols(
+    tmp_data_dir: Path, sample_stooq_csv: Path, monkeypatch, capsys
+):
+    """A symbol path that is a file or unreadable is skipped; the others are found."""
+    raw_dir = tmp_data_dir / "raw"
+    (raw_dir / "stooq" / "BRK").touch()
+    (raw_dir / "stooq" / "MSFT").mkdir()
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if Path(path).name == "MSFT":
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    found = _find_raw_files(raw_dir, "stooq", ["BRK", "MSFT", "AAPL"])
+
+    assert found == [("AAPL", sample_stooq_csv)]
+    err = capsys.readouterr().err
+    assert "No raw data for BRK from stooq" in err
+    assert "[ERROR] MSFT: " in err
+
+
+def test_is_up_to_date_after_partial_failure(
+    tmp_data_dir: Path, sample_stooq_csv: Path, monkeypatch
+):
+    """A run that fails after writing some partitions is not marked up to date."""
+    storage = StorageSettings(data_root=tmp_data_dir)
+    with sample_stooq_csv.open("a") as f:
+        f.write("\n2023-12-29,148.0,149.0,147.0,148.5,900000")
+
+    real_write = pl.DataFrame.write_parquet
+    calls = []
+
+    def fail_second_write(self, *args, **kwargs):
+        calls.append(args)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return real_write(self, *args, **kwargs)
+
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", fail_second_write)
+    with pytest.raises(OSError, match="disk full"):
+        _process_symbol("stooq", "AAPL", sample_stooq_csv, storage)
+
+    # One year partition landed, but the symbol must still be reprocessed
+    assert len(list(storage.processed_dir.rglob("data.parquet"))) == 1
+    assert not is_up_to_date(sample_stooq_csv, storage.processed_dir, "AAPL", "stooq")
+
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", real_write)
+    _process_symbol("stooq", "AAPL", sample_stooq_csv, storage)
+    assert is_up_to_date(sample_stooq_csv, storage.processed_dir, "AAPL", "stooq")
@@ -0,0 +1,53 @@
+"""Tests for the validate CLI helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+
+from CXq_data.cli.validate import _fetch_by_symbol
+from CXq_data.processing.partitioner import write_partitioned
+from CXq_data.storage.duckdb_manager import DuckDBManager
+
+
+def test_fetch_by_symbol_splits_rows(tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame):
+    """Each symbol gets its own rows; a symbol with no rows gets an empty frame."""
+    processed = tmp_data_dir / "processed"
+    write_partitioned(sample_ohlcv_df, processed)
+    manager = DuckDBManager(tmp_data_dir / "test.duckdb", processed)
+
+    with manager.connect() as db:
+        db.create_views()
+        dfs = _fetch_by_symbol(db, ["AAPL", "MSFT"])
+
+    assert len(dfs["AAPL"]) == 5
+    assert dfs["MSFT"].is_empty()
+    assert dfs["MSFT"].columns == dfs["AAPL"].columns
+
+
+def test_fetch_by_symbol_missing_view(tmp_data_dir: Path):
+    """Without a daily_ohlcv view no symbol is returned."""
+    manager = DuckDBManager(tmp_data_dir / "test.duckdb", tmp_data_dir / "processed")
+
+    with manager.connect() as db:
+        db.create_views()
+        assert _fetch_by_symbol(db, ["AAPL", "MSFT"]) == {}
+
+
+def test_fetch_by_symbol_isolates_corrupt_partition(
+    tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame
+):
+    """An unreadable partition only drops its own symbol."""
+    processed = tmp_data_dir / "processed"
+    write_partitioned(sample_ohlcv_df, processed)
+    msft = write_partitioned(sample_ohlcv_df.with_columns(symbol=pl.lit("MSFT")), processed)
+    msft[0].write_bytes(b"not a parquet file")
+    manager = DuckDBManager(tmp_data_dir / "test.duckdb", processed)
+
+    with manager.connect() as db:
+        db.create_views()
+        dfs = _fetch_by_symbol(db, ["AAPL", "MSFT"])
+
+    assert list(dfs) == ["AAPL"]
+    assert len(dfs["AAPL"]) == 5
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+from pydantic import ValidationError
+
 from CXq_data.config.settings import AppSettings, StorageSettings
 
 
@@ -19,3 +22,32 @@ def test_storage_paths():
     assert s.raw_dir.name == "raw"
     assert s.processed_dir.name == "processed"
     assert s.duckdb_path.name == "CXq_data.duckdb"
+    assert s.parquet_compression == "zstd"
+
+
+def test_storage_rejects_unknown_compression(monkeypatch):
+    """An unsupported Parquet codec or level fails at settings load."""
+    monkeypatch.setenv("STORAGE_PARQUET_COMPRESSION", "zstandard")
+    with pytest.raises(ValidationError):
+        StorageSettings()
+
+    monkeypatch.setenv("STORAGE_PARQUET_COMPRESSION", "brotli")
+    monkeypatch.setenv("STORAGE_PARQUET_COMPRESSION_LEVEL", "99")
+    with pytest.raises(ValidationError):
+        StorageSettings()
+
+
+def test_storage_rejects_level_outside_codec_range(monkeypatch):
+    """The compression level is checked against the chosen codec's range."""
+    monkeypatch.setenv("STORAGE_PARQUET_COMPRESSION", "zstd")
+    monkeypatch.setenv("STORAGE_PARQUET_COMPRESSION_LEVEL", "0")
+    with pytest.raises(ValidationError, match="out of range for zstd"):
+        StorageSettings()
+
+    monkeypatch.setenv("STORAGE_PARQUET_COMPRESSION", "gzip")
+    monkeypatch.setenv("STORAGE_PARQUET_COMPRESSION_LEVEL", "10")
+    with pytest.raises(ValidationError, match="out of range for gzip"):
+        StorageSettings()
+
+    monkeypatch.setenv("STORAGE_PARQUET_COMPRESSION_LEVEL", "9")
+    assert StorageSettings().parquet_compression_level == 9
@@ -0,0 +1,70 @@
+"""Tests for Alpha Vantage ingestor."""
+
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Response
+from pydantic import SecretStr
+
+from CXq_data.config.settings import SourceAlphaVantageSettings
+from CXq_data.ingestors.alpha_vantage import AlphaVantageIngestor
+from CXq_data.ingestors.base import IngestorError
+
+SAMPLE_JSON = """{
+    "Meta Data": {"1. Information": "Daily Time Series with Splits and Dividend Events"},
+    "Time Series (Daily)": {
+        "2024-01-03": {"1. open": "151.00", "2. high": "153.00", "3. low": "150.00",
+                       "4. close": "149.50", "5. adjusted close": "149.50",
+                       "6. volume": "1100000"},
+        "2024-01-02": {"1. open": "150.00", "2. high": "152.00", "3. low": "149.00",
+                       "4. close": "151.00", "5. adjusted close": "151.00",
+                       "6. volume": "1000000"}
+    }
+}"""
+
+
+@pytest.fixture
+def av_ingestor() -> AlphaVantageIngestor:
+    return AlphaVantageIngestor(SourceAlphaVantageSettings(api_key=SecretStr("test")))
+
+
+@respx.mock
+def test_fetch_daily_writes_response_verbatim(av_ingestor: AlphaVantageIngestor, tmp_path: Path):
+    """The raw file is the response body exactly as received."""
+    respx.get("https://www.alphavantage.co/query").mock(
+        return_value=Response(200, text=SAMPLE_JSON)
+    )
+
+    result = av_ingestor.fetch_daily(
+        symbol="MSFT",
+        start_date=datetime.date(2024, 1, 1),
+        end_date=datetime.date(2024, 1, 5),
+        output_dir=tmp_path,
+    )
+
+    assert result.source == "alpha_vantage"
+    assert result.rows_received == 2
+    assert result.start_date == datetime.date(2024, 1, 2)
+    assert result.raw_path.read_text() == SAMPLE_JSON
+
+
+@respx.mock
+def test_fetch_daily_rate_limit_note(av_ingestor: AlphaVantageIngestor, tmp_path: Path):
+    """A rate-limit 'Note' response raises IngestorError and writes nothing."""
+    respx.get("https://www.alphavantage.co/query").mock(
+        return_value=Response(200, json={"Note": "Thank you for using Alpha Vantage!"})
+    )
+
+    with pytest.raises(IngestorError, match="rate limit"):
+        av_ingestor.fetch_daily(
+            symbol="MSFT",
+            start_date=datetime.date(2024, 1, 1),
+            end_date=datetime.date(2024, 1, 5),
+            output_dir=tmp_path,
+        )
+
+    assert not any(tmp_path.rglob("*.json"))
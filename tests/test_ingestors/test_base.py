@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from CXq_data.ingestors.base import BaseIngestor
-from CXq_data.ingestors.registry import available_sources
+import sys
+
+import pytest
+
+from CXq_data.config.settings import AppSettings
+from CXq_data.ingestors import registry
+from CXq_data.ingestors.base import BaseIngestor, IngestorError
+from CXq_data.ingestors.registry import available_sources, get_ingestor
 from CXq_data.ingestors.yfinance import YFinanceIngestor
 
 
@@ -20,3 +26,26 @@ def test_available_sources():
     assert "yf" in sources
     assert "av" in sources
     assert "stooq" in sources
+
+
+def test_get_ingestor_imports_only_requested_source(monkeypatch):
+    """Requesting stooq does not import the yfinance ingestor module."""
+    monkeypatch.setattr(registry, "_REGISTRY", {})
+    monkeypatch.delitem(sys.modules, "CXq_data.ingestors.yfinance")
+
+    ingestor = get_ingestor("stooq", AppSettings())
+
+    assert ingestor.source_name == "stooq"
+    assert "CXq_data.ingestors.yfinance" not in sys.modules
+
+
+def test_get_ingestor_unimportable_source(monkeypatch):
+    """A built-in whose module fails to import raises IngestorError but stays listed."""
+    monkeypatch.setattr(registry, "_REGISTRY", {})
+    monkeypatch.setitem(
+        registry._BUILTINS, "broken", ("CXq_data.ingestors.does_not_exist", "BrokenIngestor")
+    )
+
+    assert "broken" in available_sources()
+    with pytest.raises(IngestorError, match="Source 'broken' is unavailable"):
+        get_ingestor("broken", AppSettings())
@@ -86,3 +86,36 @@ def test_normalize_stooq_daily(sample_stooq_csv: Path):
 
     # Stooq has no adjusted close — it should equal close
     assert df["adjusted_close"].to_list() == df["close"].to_list()
+
+
+def test_normalize_alpha_vantage_daily_missing_adjusted_close(tmp_path: Path):
+    """Alpha Vantage rows without an adjusted close fall back to close."""
+    av_data = {
+        "Time Series (Daily)": {
+            "2024-01-02": {
+                "1. open": "150.00",
+                "2. high": "152.00",
+                "3. low": "149.00",
+                "4. close": "151.00",
+                "6. volume": "1000000",
+            },
+            "2024-01-03": {
+                "1. open": "151.00",
+                "2. high": "153.00",
+                "3. low": "150.00",
+                "4. close": "149.50",
+                "5. adjusted close": "149.25",
+                "6. volume": "1100000",
+            },
+        },
+    }
+
+    json_path = tmp_path / "daily.json"
+    json_path.write_text(json.dumps(av_data))
+
+    df = normalize_alpha_vantage_daily(json_path, "MSFT")
+
+    assert df["adjusted_close"].to_list() == [151.0, 149.25]
+    assert df["open"].dtype == pl.Float64
+    assert df["volume"].dtype == pl.Int64
+    assert df["date"].dtype == pl.Date
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 
 import polars as pl
+import pytest
 
-from CXq_data.processing.partitioner import write_partitioned
+from CXq_data.processing.partitioner import (
+    is_up_to_date,
+    mark_processed,
+    write_partitioned,
+)
 
 
 def test_write_partitioned_creates_hive_structure(
@@ -57,3 +64,95 @@ def test_write_partitioned_multiple_years(tmp_data_dir: Path, sample_ohlcv_df: p
     assert len(paths) == 2  # 2023 and 2024
     years = {str(p.parent.name) for p in paths}
     assert years == {"year=2023", "year=2024"}
+
+
+def test_is_up_to_date(tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame):
+    """Partitions are up to date only while the raw file matches the marker exactly."""
+    processed = tmp_data_dir / "processed"
+    raw_path = tmp_data_dir / "raw" / "2024-01-15_daily.csv"
+    raw_path.write_text("placeholder")
+
+    assert not is_up_to_date(raw_path, processed, "AAPL", "test")
+
+    write_partitioned(sample_ohlcv_df, processed)
+    assert not is_up_to_date(raw_path, processed, "AAPL", "test")  # No marker yet
+
+    mark_processed(raw_path, processed, "AAPL", "test")
+    assert is_up_to_date(raw_path, processed, "AAPL", "test")
+
+    # Rolling back to an older mtime is a change too, not just a newer one
+    mtime = raw_path.stat().st_mtime_ns
+    os.utime(raw_path, ns=(mtime - 1_000_000_000, mtime - 1_000_000_000))
+    assert not is_up_to_date(raw_path, processed, "AAPL", "test")
+
+    mark_processed(raw_path, processed, "AAPL", "test")
+    raw_path.write_text("placeholder, but longer")
+    assert not is_up_to_date(raw_path, processed, "AAPL", "test")
+
+    older = tmp_data_dir / "raw" / "2024-01-10_daily.csv"
+    older.write_text("placeholder")
+    assert not is_up_to_date(older, processed, "AAPL", "test")
+
+
+def test_write_partitioned_compression(tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame):
+    """The Parquet codec is configurable."""
+    import pyarrow.parquet as pq
+
+    processed = tmp_data_dir / "processed"
+    paths = write_partitioned(sample_ohlcv_df, processed, compression="snappy")
+
+    metadata = pq.ParquetFile(paths[0]).metadata
+    assert metadata.row_group(0).column(0).compression == "SNAPPY"
+
+
+def test_write_partitioned_failure_keeps_existing_file(
+    tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame, monkeypatch
+):
+    """A failed rewrite leaves the previous partition intact and no temp file."""
+    processed = tmp_data_dir / "processed"
+    paths = write_partitioned(sample_ohlcv_df, processed)
+    original = paths[0].read_bytes()
+
+    def fail_write(self, *args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", fail_write)
+
+    with pytest.raises(OSError, match="disk full"):
+        write_partitioned(sample_ohlcv_df, processed)
+
+    assert paths[0].read_bytes() == original
+    assert list(paths[0].parent.iterdir()) == [paths[0]]
+
+
+def test_write_partitioned_concurrent_writers(tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame):
+    """Concurrent writers to the same partition do not clobber each other's temp files."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    processed = tmp_data_dir / "processed"
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(write_partitioned, sample_ohlcv_df, processed) for _ in range(16)]
+        results = [f.result() for f in futures]
+
+    out_path = results[0][0]
+    assert all(paths == [out_path] for paths in results)
+    assert len(pl.read_parquet(out_path)) == 5
+    assert list(out_path.parent.iterdir()) == [out_path]
+
+
+def test_written_files_follow_umask(tmp_data_dir: Path, sample_ohlcv_df: pl.DataFrame):
+    """Partitions and the marker get the usual umask mode, readable by other users."""
+    processed = tmp_data_dir / "processed"
+    raw_path = tmp_data_dir / "raw" / "2024-01-15_daily.csv"
+    raw_path.write_text("placeholder")
+
+    old_umask = os.umask(0o022)
+    try:
+        paths = write_partitioned(sample_ohlcv_df, processed)
+        mark_processed(raw_path, processed, "AAPL", "test")
+    finally:
+        os.umask(old_umask)
+
+    marker = paths[0].parent.parent / ".processed.json"
+    assert stat.S_IMODE(paths[0].stat().st_mode) == 0o644
+    assert stat.S_IMODE(marker.stat().st_mode) == 0o644
@@ -100,3 +100,63 @@ def test_trading_day_gaps_detects_missing_days():
     result = check_trading_day_gaps(df, "AAPL")
     assert result.status in (CheckStatus.WARN, CheckStatus.FAIL)
     assert "missing" in result.message.lower()
+
+
+def test_trading_day_gaps_warn_fail_boundary():
+    """Three consecutive missing weekdays warn; four (bridging a weekend) fail."""
+
+    def bars(dates: list[datetime.date]) -> pl.DataFrame:
+        n = len(dates)
+        return pl.DataFrame(
+            {
+                "date": dates,
+                "open": [150.0] * n,
+                "high": [152.0] * n,
+                "low": [149.0] * n,
+                "close": [151.0] * n,
+                "adjusted_close": [151.0] * n,
+                "volume": [1000000] * n,
+                "source": ["test"] * n,
+                "ingested_at": [datetime.datetime.now(datetime.timezone.utc)] * n,
+            }
+        )
+
+    # Jan 3-5 missing
+    result = check_trading_day_gaps(
+        bars([datetime.date(2024, 1, 2), datetime.date(2024, 1, 8)]), "AAPL"
+    )
+    assert result.status == CheckStatus.WARN
+    assert result.message == "3 missing trading day(s), longest gap: 3"
+
+    # Jan 3-5 and Jan 8 missing
+    result = check_trading_day_gaps(
+        bars([datetime.date(2024, 1, 2), datetime.date(2024, 1, 9)]), "AAPL"
+    )
+    assert result.status == CheckStatus.FAIL
+    assert result.message == "4 missing trading day(s), longest gap: 4"
+    assert result.details["missing_dates"] == [
+        "2024-01-03",
+        "2024-01-04",
+        "2024-01-05",
+        "2024-01-08",
+    ]
+
+
+def test_ohlc_consistency_warns_zero_volume_movement():
+    """Zero volume with a >1% move should warn and report the row count."""
+    df = pl.DataFrame(
+        {
+            "date": [datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)],
+            "open": [100.0, 100.0],
+            "high": [105.0, 101.0],
+            "low": [99.0, 99.5],
+            "close": [104.0, 100.5],  # 4% and 0.5% moves
+            "adjusted_close": [104.0, 100.5],
+            "volume": [0, 0],
+            "source": ["test", "test"],
+            "ingested_at": [datetime.datetime.now(datetime.timezone.utc)] * 2,
+        }
+    )
+    result = check_ohlc_consistency(df, "ILLIQ")
+    assert result.status == CheckStatus.WARN
+    assert result.message == "1 rows with zero volume but >1% price movement"